@@ -1310,6 +1310,20 @@ class Application:
             # 7. Close the MCP server
             await self._safe_close_resource(self.mcp_server, "MCP Server")
 
+            # Release IoT device resources (e.g. the music player's mixer)
+            from src.iot.thing_manager import ThingManager
+
+            await self._safe_close_resource(ThingManager.get_instance(), "IoT Devices")
+
+            # Close the pooled HTTP connections of the search tools
+            try:
+                from src.mcp.tools.search.manager import cleanup_search_manager
+
+                await cleanup_search_manager()
+                logger.info("Search manager has been closed")
+            except Exception as e:
+                logger.error(f"Failed to close search manager: {e}")
+
             # 8. Clear the queues
             try:
                 for q in [
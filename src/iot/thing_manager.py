@@ -42,6 +42,19 @@ class ThingManager:
     def add_thing(self, thing: Thing) -> None:
         self.things.append(thing)
 
+    async def close(self):
+        """
+        Release resources held by devices that support explicit shutdown.
+        """
+        for thing in self.things:
+            aclose = getattr(thing, "aclose", None)
+            if aclose is None:
+                continue
+            try:
+                await aclose()
+            except Exception as e:
+                logger.error(f"Failed to close device {thing.name}: {e}")
+
     async def get_descriptors_json(self) -> str:
         """
         Get the descriptor JSON for all devices.
@@ -1,12 +1,15 @@
 import asyncio
-import shutil
+import bisect
+import json
+import os
 import tempfile
 import time
 from pathlib import Path
 from typing import Optional, Tuple
 
+import aiofiles
+import aiohttp
 import pygame
-import requests
 
 from src.constants.constants import AudioConfig
 from src.iot.thing import Parameter, Thing, ValueType
@@ -22,19 +25,21 @@ class MusicPlayer(Thing):
     Only core functions are retained: search, play, pause, stop, seek
     """
 
+    # Delay (seconds) used to coalesce bursts of UI updates
+    UI_COALESCE_INTERVAL = 0.05
+
     def __init__(self):
         super().__init__("MusicPlayer", "Music player, supports online music playback control")
 
-        # Initialize pygame mixer
-        pygame.mixer.init(
-            frequency=AudioConfig.OUTPUT_SAMPLE_RATE, channels=AudioConfig.CHANNELS
-        )
+        # pygame mixer is initialized on first playback, see _ensure_mixer
+        self._mixer_ready = False
 
         # Core playback state
         self.current_song = ""
         self.current_url = ""
         self.song_id = ""
         self.total_duration = 0
+        self._duration_str = "00:00"  # total_duration formatted once per track
         self.is_playing = False
         self.paused = False
         self.current_position = 0
@@ -42,11 +47,20 @@ class MusicPlayer(Thing):
 
         # Lyrics related
         self.lyrics = []  # List of lyrics, format: [(time, text), ...]
+        # Lyric timestamps (sorted) and texts as parallel lists, built from self.lyrics
+        self._lyric_times = []
+        self._lyric_texts = []
         self.current_lyric_index = -1  # Current lyric index
+        self._lyrics_fetch_task: Optional[asyncio.Task] = None
+        self._lyrics_task: Optional[asyncio.Task] = None
+        # Set on pause/resume/seek/stop so the lyrics task wakes up before its timer
+        self._playback_state_changed = asyncio.Event()
+        # Cleared while paused; the lyrics task blocks on it instead of polling
+        self._resume_event = asyncio.Event()
+        self._resume_event.set()
 
         # Cache directory settings
         self.cache_dir = Path(get_project_root()) / "cache" / "music"
-        self.temp_cache_dir = self.cache_dir / "temp"
         self._init_cache_dirs()
 
         # API configuration
@@ -63,11 +77,21 @@ class MusicPlayer(Thing):
             },
         }
 
+        # Shared HTTP session for search, play-url, lyrics and downloads,
+        # created lazily on the event loop so keep-alive connections are reused
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._api_timeout = aiohttp.ClientTimeout(total=10)
+
         # Clean temporary cache
         self._clean_temp_cache()
 
-        # Get application instance
+        # Get application instance and cache its UI callback
         self.app = None
+        self._set_chat_message = None
+
+        # UI messages are coalesced so bursts (seeks, pause toggles) send only the latest
+        self._pending_ui_msg: Optional[str] = None
+        self._ui_flush_task: Optional[asyncio.Task] = None
         self._initialize_app_reference()
 
         logger.info("Simplified music player initialization complete")
@@ -85,6 +109,28 @@ class MusicPlayer(Thing):
             logger.warning(f"Failed to get Application instance: {e}")
             self.app = None
 
+        self._set_chat_message = getattr(self.app, "set_chat_message", None)
+
+    def _ensure_mixer(self):
+        """
+        Initialize the pygame mixer on first use.
+        """
+        if not self._mixer_ready:
+            pygame.mixer.init(
+                frequency=AudioConfig.OUTPUT_SAMPLE_RATE, channels=AudioConfig.CHANNELS
+            )
+            self._mixer_ready = True
+
+    async def _ensure_session(self):
+        """
+        Ensures an aiohttp session exists.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.config["HEADERS"],
+                timeout=aiohttp.ClientTimeout(sock_connect=30, sock_read=30),
+            )
+
     def _init_cache_dirs(self):
         """
         Initialize cache directories.
@@ -92,24 +138,25 @@ class MusicPlayer(Thing):
         try:
             # Create main cache directory
             self.cache_dir.mkdir(parents=True, exist_ok=True)
-            # Create temporary cache directory
-            self.temp_cache_dir.mkdir(parents=True, exist_ok=True)
             logger.info(f"Music cache directory initialized: {self.cache_dir}")
         except Exception as e:
             logger.error(f"Failed to create cache directory: {e}")
             # Fall back to system temporary directory
             self.cache_dir = Path(tempfile.gettempdir()) / "xiaozhi_music_cache"
-            self.temp_cache_dir = self.cache_dir / "temp"
             self.cache_dir.mkdir(parents=True, exist_ok=True)
-            self.temp_cache_dir.mkdir(parents=True, exist_ok=True)
 
     def _clean_temp_cache(self):
         """
         Clean temporary cache files.
         """
         try:
-            # Clear all files in the temporary cache directory
-            for file_path in self.temp_cache_dir.glob("*"):
+            # Unfinished downloads, plus the temp directory used by older versions
+            leftovers = list(self.cache_dir.glob("*.partial"))
+            legacy_temp_dir = self.cache_dir / "temp"
+            if legacy_temp_dir.is_dir():
+                leftovers.extend(legacy_temp_dir.glob("*"))
+
+            for file_path in leftovers:
                 try:
                     if file_path.is_file():
                         file_path.unlink()
@@ -198,11 +245,14 @@ class MusicPlayer(Thing):
             self.is_playing = False
             self.paused = False
             self.current_position = self.total_duration
+            self._resume_event.set()
+            self._playback_state_changed.set()
 
             # Update UI to show completion status
-            if self.app and hasattr(self.app, "set_chat_message"):
-                dur_str = self._format_time(self.total_duration)
-                await self._safe_update_ui(f"Playback finished: {self.current_song} [{dur_str}]")
+            if self._set_chat_message:
+                await self._safe_update_ui(
+                    f"Playback finished: {self.current_song} [{self._duration_str}]"
+                )
 
     # Core methods
     async def search_and_play(self, params):
@@ -248,12 +298,15 @@ class MusicPlayer(Thing):
 
             elif self.is_playing and self.paused:
                 # Resume playback
+                self._ensure_mixer()
                 pygame.mixer.music.unpause()
                 self.paused = False
                 self.start_play_time = time.time() - self.current_position
+                self._resume_event.set()
+                self._playback_state_changed.set()
 
                 # Update UI
-                if self.app and hasattr(self.app, "set_chat_message"):
+                if self._set_chat_message:
                     await self._safe_update_ui(f"Resuming playback: {self.current_song}")
 
                 return {
@@ -266,13 +319,14 @@ class MusicPlayer(Thing):
                 pygame.mixer.music.pause()
                 self.paused = True
                 self.current_position = time.time() - self.start_play_time
+                self._resume_event.clear()
+                self._playback_state_changed.set()
 
                 # Update UI
-                if self.app and hasattr(self.app, "set_chat_message"):
+                if self._set_chat_message:
                     pos_str = self._format_time(self.current_position)
-                    dur_str = self._format_time(self.total_duration)
                     await self._safe_update_ui(
-                        f"Paused: {self.current_song} [{pos_str}/{dur_str}]"
+                        f"Paused: {self.current_song} [{pos_str}/{self._duration_str}]"
                     )
 
                 return {"status": "success", "message": f"Paused: {self.current_song}"}
@@ -297,9 +351,11 @@ class MusicPlayer(Thing):
             self.is_playing = False
             self.paused = False
             self.current_position = 0
+            self._resume_event.set()
+            self._playback_state_changed.set()
 
             # Update UI
-            if self.app and hasattr(self.app, "set_chat_message"):
+            if self._set_chat_message:
                 await self._safe_update_ui(f"Stopped: {current_song}")
 
             return {"status": "success", "message": f"Stopped: {current_song}"}
@@ -318,21 +374,24 @@ class MusicPlayer(Thing):
             if not self.is_playing:
                 return {"status": "error", "message": "No song is currently playing"}
 
+            self._ensure_mixer()
             position = max(0, min(position, self.total_duration))
             self.current_position = position
             self.start_play_time = time.time() - position
 
-            pygame.mixer.music.rewind()
+            # set_pos seeks to an absolute position, no rewind needed
             pygame.mixer.music.set_pos(position)
+            # Reset so the lyrics loop looks the line up again and shows it
+            self.current_lyric_index = -1
 
             if self.paused:
                 pygame.mixer.music.pause()
+            self._playback_state_changed.set()
 
             # Update UI
             pos_str = self._format_time(position)
-            dur_str = self._format_time(self.total_duration)
-            if self.app and hasattr(self.app, "set_chat_message"):
-                await self._safe_update_ui(f"Seeked to: {pos_str}/{dur_str}")
+            if self._set_chat_message:
+                await self._safe_update_ui(f"Seeked to: {pos_str}/{self._duration_str}")
 
             return {"status": "success", "message": f"Seeked to: {position:.1f} seconds"}
 
@@ -388,34 +447,33 @@ class MusicPlayer(Thing):
             }
 
             # Search for song
-            response = await asyncio.to_thread(
-                requests.get,
-                self.config["SEARCH_URL"],
-                params=params,
-                headers=self.config["HEADERS"],
-                timeout=10,
-            )
-            response.raise_for_status()
+            await self._ensure_session()
+            async with self._session.get(
+                self.config["SEARCH_URL"], params=params, timeout=self._api_timeout
+            ) as response:
+                response.raise_for_status()
+                text = await response.text()
 
             # Parse response
-            text = response.text.replace("'", '"')
+            item = self._parse_search_item(text)
 
             # Extract song ID
-            song_id = self._extract_value(text, '"DC_TARGETID":"', '"')
+            song_id = str(item.get("DC_TARGETID") or "")
             if not song_id:
                 return "", ""
 
             # Extract song information
-            title = self._extract_value(text, '"NAME":"', '"') or song_name
-            artist = self._extract_value(text, '"ARTIST":"', '"')
-            album = self._extract_value(text, '"ALBUM":"', '"')
-            duration_str = self._extract_value(text, '"DURATION":"', '"')
+            title = item.get("NAME") or song_name
+            artist = item.get("ARTIST")
+            album = item.get("ALBUM")
+            duration_str = item.get("DURATION")
 
             if duration_str:
                 try:
                     self.total_duration = int(duration_str)
                 except ValueError:
                     self.total_duration = 0
+            self._duration_str = self._format_time(self.total_duration)
 
             # Set display name
             display_name = title
@@ -426,19 +484,28 @@ class MusicPlayer(Thing):
             self.current_song = display_name
             self.song_id = song_id
 
-            # Get playback URL
-            play_url = f"{self.config['PLAY_URL']}?ID={song_id}"
-            url_response = await asyncio.to_thread(
-                requests.get, play_url, headers=self.config["HEADERS"], timeout=10
-            )
-            url_response.raise_for_status()
+            # Fetch lyrics in the background while the playback URL is resolved;
+            # they only replace the current lyrics once this song starts playing
+            lyrics_task = asyncio.create_task(self._fetch_lyrics(song_id))
+            try:
+                # Get playback URL
+                play_url = f"{self.config['PLAY_URL']}?ID={song_id}"
+                async with self._session.get(
+                    play_url, timeout=self._api_timeout
+                ) as url_response:
+                    url_response.raise_for_status()
+                    play_url_text = (await url_response.text()).strip()
+            except BaseException:
+                lyrics_task.cancel()
+                raise
 
-            play_url_text = url_response.text.strip()
             if play_url_text and play_url_text.startswith("http"):
-                # Fetch lyrics
-                await self._fetch_lyrics(song_id)
+                if self._lyrics_fetch_task and not self._lyrics_fetch_task.done():
+                    self._lyrics_fetch_task.cancel()
+                self._lyrics_fetch_task = lyrics_task
                 return song_id, play_url_text
 
+            lyrics_task.cancel()
             return song_id, ""
 
         except Exception as e:
@@ -460,6 +527,7 @@ class MusicPlayer(Thing):
                 return False
 
             # Load and play
+            self._ensure_mixer()
             pygame.mixer.music.load(str(file_path))
             pygame.mixer.music.play()
 
@@ -469,15 +537,18 @@ class MusicPlayer(Thing):
             self.current_position = 0
             self.start_play_time = time.time()
             self.current_lyric_index = -1  # Reset lyric index
+            self._resume_event.set()
 
             logger.info(f"Starting playback: {self.current_song}")
 
             # Update UI
-            if self.app and hasattr(self.app, "set_chat_message"):
+            if self._set_chat_message:
                 await self._safe_update_ui(f"Now playing: {self.current_song}")
 
-            # Start lyrics update task
-            asyncio.create_task(self._lyrics_update_task())
+            # Start lyrics update task, replacing the one of the previous song
+            if self._lyrics_task and not self._lyrics_task.done():
+                self._lyrics_task.cancel()
+            self._lyrics_task = asyncio.create_task(self._lyrics_update_task())
 
             return True
 
@@ -510,32 +581,27 @@ class MusicPlayer(Thing):
     async def _download_file(self, url: str, filename: str) -> Optional[Path]:
         """Download file to cache directory.
 
-        First download to a temporary directory, then move to the official cache directory after completion
+        Download to a .partial file next to the cache entry, then atomically
+        rename it into place after completion
         """
         temp_path = None
         try:
-            # Create temporary file path
-            temp_path = self.temp_cache_dir / f"temp_{int(time.time())}_{filename}"
+            # Create temporary file path on the same filesystem as the cache
+            cache_path = self.cache_dir / filename
+            temp_path = cache_path.with_name(f"{filename}.partial")
 
-            # Asynchronous download
-            response = await asyncio.to_thread(
-                requests.get,
-                url,
-                headers=self.config["HEADERS"],
-                stream=True,
-                timeout=30,
-            )
-            response.raise_for_status()
+            # Asynchronous streaming download
+            await self._ensure_session()
+            async with self._session.get(url) as response:
+                response.raise_for_status()
 
-            # Write to temporary file
-            with open(temp_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+                # Write to temporary file
+                async with aiofiles.open(temp_path, "wb") as f:
+                    async for chunk in response.content.iter_chunked(65536):
+                        await f.write(chunk)
 
-            # Download complete, move to official cache directory
-            cache_path = self.cache_dir / filename
-            shutil.move(str(temp_path), str(cache_path))
+            # Download complete, rename into the cache
+            os.replace(temp_path, cache_path)
 
             logger.info(f"Music downloaded and cached: {cache_path}")
             return cache_path
@@ -551,26 +617,25 @@ class MusicPlayer(Thing):
                     pass
             return None
 
-    async def _fetch_lyrics(self, song_id: str):
+    async def _fetch_lyrics(self, song_id: str) -> list:
         """
-        Fetch lyrics.
+        Fetch lyrics, returned as [(time, text), ...]; empty if unavailable.
         """
+        lyrics = []
         try:
-            # Reset lyrics
-            self.lyrics = []
-
             # Build lyrics API request
             lyric_url = self.config.get("LYRIC_URL")
             lyric_api_url = f"{lyric_url}?musicId={song_id}"
             logger.info(f"Fetching lyrics URL: {lyric_api_url}")
 
-            response = await asyncio.to_thread(
-                requests.get, lyric_api_url, headers=self.config["HEADERS"], timeout=10
-            )
-            response.raise_for_status()
+            await self._ensure_session()
+            async with self._session.get(
+                lyric_api_url, timeout=self._api_timeout
+            ) as response:
+                response.raise_for_status()
 
-            # Parse JSON
-            data = response.json()
+                # Parse JSON
+                data = await response.json(content_type=None)
 
             # Parse lyrics
             if (
@@ -592,26 +657,48 @@ class MusicPlayer(Thing):
                         and not text.startswith("作曲")
                         and not text.startswith("编曲")
                     ):
-                        self.lyrics.append((time_sec, text))
+                        lyrics.append((time_sec, text))
 
-                logger.info(f"Successfully fetched lyrics, {len(self.lyrics)} lines in total")
+                logger.info(f"Successfully fetched lyrics, {len(lyrics)} lines in total")
             else:
                 logger.warning(f"Failed to fetch lyrics or lyrics format error: {data.get('msg', '')}")
 
         except Exception as e:
             logger.error(f"Failed to fetch lyrics: {e}")
 
+        return lyrics
+
+    def _set_lyrics(self, lyrics: list):
+        """
+        Replace the lyrics and the timestamp index used to look them up.
+        """
+        self.lyrics = lyrics
+        self._lyric_times = [time_sec for time_sec, _ in lyrics]
+        self._lyric_texts = [text for _, text in lyrics]
+        self.current_lyric_index = -1
+
     async def _lyrics_update_task(self):
         """
         Lyrics update task.
         """
+        # Lyrics are fetched concurrently with the audio, wait for them here and
+        # install them; on replay the task was already consumed
+        fetch_task = self._lyrics_fetch_task
+        if fetch_task is not None:
+            if not fetch_task.done():
+                await asyncio.wait({fetch_task})
+            if fetch_task is self._lyrics_fetch_task:
+                self._lyrics_fetch_task = None
+                self._set_lyrics([] if fetch_task.cancelled() else fetch_task.result())
+
         if not self.lyrics:
             return
 
         try:
             while self.is_playing:
                 if self.paused:
-                    await asyncio.sleep(0.5)
+                    # Woken by resume, or by stop so the loop can exit
+                    await self._resume_event.wait()
                     continue
 
                 current_time = time.time() - self.start_play_time
@@ -628,32 +715,50 @@ class MusicPlayer(Thing):
                 if current_index != self.current_lyric_index:
                     await self._display_current_lyric(current_index)
 
-                await asyncio.sleep(0.2)
+                # Sleep until the next line is due (or the song ends)
+                next_index = current_index + 1
+                if next_index < len(self._lyric_times):
+                    wake_time = self._lyric_times[next_index] + 0.5
+                else:
+                    wake_time = self.total_duration
+                await self._wait_for_state_change(wake_time - current_time)
         except Exception as e:
             logger.error(f"Lyrics update task exception: {e}")
 
+    async def _wait_for_state_change(self, timeout: float):
+        """
+        Wait until the timeout elapses or the playback state changes.
+        """
+        self._playback_state_changed.clear()
+        try:
+            await asyncio.wait_for(
+                self._playback_state_changed.wait(), max(0.0, timeout)
+            )
+        except asyncio.TimeoutError:
+            pass
+
     def _find_current_lyric_index(self, current_time: float) -> int:
         """
         Find the lyric index corresponding to the current time.
         """
-        # Find the next line of lyrics
-        next_lyric_index = None
-        for i, (time_sec, _) in enumerate(self.lyrics):
-            # Add a small offset (0.5 seconds) to make the lyric display more accurate
-            if time_sec > current_time - 0.5:
-                next_lyric_index = i
-                break
-
-        # Determine the current lyric index
-        if next_lyric_index is not None and next_lyric_index > 0:
-            # If the next line is found, the current line is the one before it
-            return next_lyric_index - 1
-        elif next_lyric_index is None and self.lyrics:
-            # If the next line is not found, it means it's the last line
-            return len(self.lyrics) - 1
-        else:
-            # Other cases (e.g., playback just started)
-            return 0
+        # Add a small offset (0.5 seconds) to make the lyric display more accurate
+        target_time = current_time - 0.5
+        times = self._lyric_times
+        count = len(times)
+
+        # During normal playback the line is still the current one or the next one
+        for index in (self.current_lyric_index, self.current_lyric_index + 1):
+            if (
+                0 <= index < count
+                and times[index] <= target_time
+                and (index + 1 == count or target_time < times[index + 1])
+            ):
+                return index
+
+        # Otherwise (e.g. after a seek) the current line is the one before the first
+        # line starting after target_time, or the first line if playback just started
+        next_lyric_index = bisect.bisect_right(times, target_time)
+        return max(0, next_lyric_index - 1)
 
     async def _display_current_lyric(self, current_index: int):
         """
@@ -661,34 +766,50 @@ class MusicPlayer(Thing):
         """
         self.current_lyric_index = current_index
 
-        if current_index < len(self.lyrics):
-            time_sec, text = self.lyrics[current_index]
+        # Nothing to format when there is no UI to show it
+        if self._set_chat_message is None or current_index >= len(self._lyric_texts):
+            return
 
-            # Add time and progress information before the lyric
-            position_str = self._format_time(time.time() - self.start_play_time)
-            duration_str = self._format_time(self.total_duration)
-            display_text = f"[{position_str}/{duration_str}] {text}"
+        text = self._lyric_texts[current_index]
 
-            # Update UI
-            if self.app and hasattr(self.app, "set_chat_message"):
-                await self._safe_update_ui(display_text)
-                logger.debug(f"Displaying lyric: {text}")
+        # Add time and progress information before the lyric
+        position_str = self._format_time(time.time() - self.start_play_time)
+        display_text = f"[{position_str}/{self._duration_str}] {text}"
 
-    def _extract_value(self, text: str, start_marker: str, end_marker: str) -> str:
+        # Update UI
+        await self._queue_lyric_update(display_text)
+        logger.debug(f"Displaying lyric: {text}")
+
+    def _parse_search_item(self, text: str) -> dict:
         """
-        Extract value from text.
+        Parse the first hit of a Kuwo search response.
         """
-        start_pos = text.find(start_marker)
-        if start_pos == -1:
-            return ""
+        try:
+            data = json.loads(text)
+        except ValueError:
+            data = None
 
-        start_pos += len(start_marker)
-        end_pos = text.find(end_marker, start_pos)
+        if isinstance(data, dict):
+            abslist = data.get("abslist") or [{}]
+            return abslist[0]
 
-        if end_pos == -1:
+        # Kuwo often answers with single-quoted pseudo-JSON, scan for the fields
+        text = text.replace("'", '"')
+        return {
+            key: self._extract_value(text, f'"{key}":"', '"')
+            for key in ("DC_TARGETID", "NAME", "ARTIST", "ALBUM", "DURATION")
+        }
+
+    def _extract_value(self, text: str, start_marker: str, end_marker: str) -> str:
+        """
+        Extract value from text.
+        """
+        _, found, tail = text.partition(start_marker)
+        if not found:
             return ""
 
-        return text[start_pos:end_pos]
+        value, found, _ = tail.partition(end_marker)
+        return value if found else ""
 
     def _format_time(self, seconds: float) -> str:
         """
@@ -699,24 +820,78 @@ class MusicPlayer(Thing):
         return f"{minutes:02d}:{seconds:02d}"
 
     async def _safe_update_ui(self, message: str):
+        """Safely update UI.
+
+        State messages (now playing, paused, seeked, ...) are always sent, right
+        away and after any lyric line still pending so the order is kept.
         """
-        Safely update UI.
+        if self._set_chat_message is None:
+            return
+
+        self._send_pending_lyric()
+        self._send_ui_message(message)
+
+    async def _queue_lyric_update(self, message: str):
+        """Queue a lyric/progress line for the UI.
+
+        Lyric lines are coalesced: only the latest one queued within
+        UI_COALESCE_INTERVAL is sent.
         """
-        if not self.app or not hasattr(self.app, "set_chat_message"):
+        if self._set_chat_message is None:
             return
 
+        self._pending_ui_msg = message
+        if self._ui_flush_task is None or self._ui_flush_task.done():
+            self._ui_flush_task = asyncio.create_task(self._flush_ui_update())
+
+    async def _flush_ui_update(self):
+        """
+        Send the latest pending lyric line.
+        """
+        await asyncio.sleep(self.UI_COALESCE_INTERVAL)
+        self._send_pending_lyric()
+
+    def _send_pending_lyric(self):
+        """
+        Send the pending lyric line, if any.
+        """
+        message, self._pending_ui_msg = self._pending_ui_msg, None
+        if message is not None:
+            self._send_ui_message(message)
+
+    def _send_ui_message(self, message: str):
+        """
+        Send a message to the UI, logging failures.
+        """
         try:
-            self.app.set_chat_message("assistant", message)
+            self._set_chat_message("assistant", message)
         except Exception as e:
             logger.error(f"Failed to update UI: {e}")
 
-    def __del__(self):
+    async def aclose(self):
         """
-        Clean up resources.
+        Release playback tasks, the HTTP session and the mixer.
         """
-        try:
-            # If the program exits normally, clean the temporary cache one more time
-            self._clean_temp_cache()
-        except Exception:
-            # Ignore errors, as various exceptions can occur during object destruction
-            pass
+        tasks = [
+            task
+            for task in (self._lyrics_fetch_task, self._lyrics_task, self._ui_flush_task)
+            if task and not task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._session and not self._session.closed:
+            await self._session.close()
+            self._session = None
+
+        if self._mixer_ready:
+            pygame.mixer.music.stop()
+            pygame.mixer.quit()
+            self._mixer_ready = False
+        self.is_playing = False
+        self.paused = False
+
+        # Remove unfinished downloads before exit
+        self._clean_temp_cache()
@@ -2,10 +2,10 @@ import io
 import signal
 import sys
 import threading
+from collections import OrderedDict
 from contextlib import redirect_stdout, redirect_stderr
-from typing import Any, Dict
-
-from .models import PythonInterpreterResult
+from types import CodeType
+from typing import Any, Dict, Tuple
 
 # Modules that are not allowed to be imported in sandboxed execution
 BLOCKED_MODULES = {
@@ -24,6 +24,10 @@ BLOCKED_BUILTINS = {
 
 MAX_EXECUTION_TIME = 10  # seconds
 MAX_OUTPUT_LENGTH = 10000  # characters
+CODE_CACHE_SIZE = 128  # compiled snippets kept for repeated calls
+
+# Built-ins that write to stdout; expressions using them still need output capture
+OUTPUT_BUILTINS = {"print", "help"}
 
 
 ALLOWED_MODULES = {
@@ -84,6 +88,43 @@ def _create_safe_globals():
     return safe_globals
 
 
+_code_cache: "OrderedDict[str, Tuple[CodeType, bool]]" = OrderedDict()
+
+
+def _referenced_names(code_obj: CodeType) -> set:
+    """Collect the names used by a code object and the code objects nested in it."""
+    names = set(code_obj.co_names)
+    for const in code_obj.co_consts:
+        if isinstance(const, CodeType):
+            names |= _referenced_names(const)
+    return names
+
+
+def _compile_cached(code: str) -> Tuple[CodeType, bool]:
+    """Compile code, reusing the code object of recently executed snippets.
+
+    Returns the code object and whether it is a single expression that cannot
+    write to stdout, which can be evaluated without redirecting output.
+    """
+    cached = _code_cache.get(code)
+    if cached is not None:
+        _code_cache.move_to_end(code)
+        return cached
+
+    try:
+        code_obj = compile(code, "<string>", "eval")
+        quiet_expression = not (OUTPUT_BUILTINS & _referenced_names(code_obj))
+    except SyntaxError:
+        code_obj = compile(code, "<string>", "exec")
+        quiet_expression = False
+
+    cached = (code_obj, quiet_expression)
+    _code_cache[code] = cached
+    if len(_code_cache) > CODE_CACHE_SIZE:
+        _code_cache.popitem(last=False)
+    return cached
+
+
 def execute_python_code(code: str) -> Dict[str, Any]:
     """
     Executes Python code in a sandboxed environment with timeout protection.
@@ -95,6 +136,8 @@ def execute_python_code(code: str) -> Dict[str, Any]:
     - No dynamic code execution (exec, eval, compile blocked)
     - 10 second timeout
     - Output limited to 10000 characters
+
+    Returns a plain dict with the fields of PythonInterpreterResult.
     """
     stdout_capture = io.StringIO()
     stderr_capture = io.StringIO()
@@ -109,22 +152,33 @@ def execute_python_code(code: str) -> Dict[str, Any]:
     code_lower = code.lower().replace(" ", "")
     for pattern in dangerous_patterns:
         if pattern.replace(" ", "") in code_lower:
-            return PythonInterpreterResult(
-                stdout="",
-                stderr=f"Security error: '{pattern}' is not allowed in sandboxed execution",
-                result=None,
-            ).dict()
+            return {
+                "stdout": "",
+                "stderr": f"Security error: '{pattern}' is not allowed in sandboxed execution",
+                "result": None,
+            }
+
+    try:
+        code_obj, quiet_expression = _compile_cached(code)
+    except Exception as e:
+        # compile() can also raise MemoryError, RecursionError or ValueError
+        return {"stdout": "", "stderr": str(e), "result": None}
 
     safe_globals = _create_safe_globals()
     local_vars = {}
 
     # Execute with timeout
     execution_error = [None]
+    expression_value = [None]
 
     def target():
         try:
+            if quiet_expression:
+                # Nothing to capture, the value of the expression is the result
+                expression_value[0] = eval(code_obj, safe_globals, local_vars)
+                return
             with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-                exec(code, safe_globals, local_vars)
+                exec(code_obj, safe_globals, local_vars)
         except Exception as e:
             execution_error[0] = e
 
@@ -137,7 +191,9 @@ def execute_python_code(code: str) -> Dict[str, Any]:
     elif execution_error[0]:
         stderr_capture.write(str(execution_error[0]))
 
-    if 'result' in local_vars:
+    if quiet_expression:
+        result = expression_value[0]
+    elif 'result' in local_vars:
         result = local_vars['result']
 
     stdout = stdout_capture.getvalue()[:MAX_OUTPUT_LENGTH]
@@ -146,4 +202,4 @@ def execute_python_code(code: str) -> Dict[str, Any]:
     if len(stdout_capture.getvalue()) > MAX_OUTPUT_LENGTH:
         stdout += f"\n... (output truncated at {MAX_OUTPUT_LENGTH} characters)"
 
-    return PythonInterpreterResult(stdout=stdout, stderr=stderr, result=result).dict()
+    return {"stdout": stdout, "stderr": stderr, "result": result}
@@ -2,12 +2,16 @@
 Search Client - Implements asynchronous Bing search and webpage content fetching.
 """
 
+import asyncio
+import codecs
 import re
-from typing import List, Optional
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 
 import aiohttp
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from src.utils.logging_config import get_logger
 
@@ -15,14 +19,160 @@ from .models import SearchQuery, SearchResult
 
 logger = get_logger(__name__)
 
+# Prefer the C-based lxml parser when it is installed
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Bing result selectors, tried in order until one yields results
+RESULT_SELECTORS = (
+    "#b_results > li.b_algo",
+    "#b_results > .b_ans",
+    "#b_results > li:not(.b_ad)",
+    ".b_algo",
+)
+
+# Elements removed before extracting webpage text, matched in a single pass
+DROP_SELECTOR = ", ".join(
+    (
+        "script",
+        "style",
+        "iframe",
+        "noscript",
+        "nav",
+        "header",
+        "footer",
+        ".ad",
+        ".advertisement",
+        ".sidebar",
+        ".nav",
+        ".header",
+        ".footer",
+    )
+)
+
+# Candidate main-content containers, most specific first
+CONTENT_SELECTORS = (
+    "main",
+    "article",
+    ".article",
+    ".post",
+    ".content",
+    "#content",
+    ".main",
+    "#main",
+    ".body",
+    "#body",
+    ".entry",
+    ".entry-content",
+    ".post-content",
+    ".article-content",
+    ".text",
+    ".detail",
+)
+
+# Only the results container of a Bing page is inspected, so only it is parsed
+RESULTS_STRAINER = SoupStrainer(id="b_results")
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+FETCH_CHUNK_SIZE = 16384
+# HTML characters handed to the parser; a heuristic that keeps parse time
+# bounded, since the title and leading content fit well within it
+MAX_PARSE_CHARS = 200_000
+# Bytes of HTML read from a page; independent of the requested text length,
+# since a page may carry a large head before its body starts. Four bytes
+# cover MAX_PARSE_CHARS characters in any UTF-8 text
+FETCH_MAX_BYTES = MAX_PARSE_CHARS * 4
+# Bodies declared larger than this are not webpages worth reading
+MAX_CONTENT_LENGTH = 5_000_000
+
+# Extracted page texts kept, keyed by (url, max_length)
+CONTENT_CACHE_SIZE = 128
+CONTENT_CACHE_TTL = 300  # seconds
+
+# LRU cache of extracted page text with the monotonic time it was stored,
+# shared by all SearchClient instances
+_content_cache: "OrderedDict[Tuple[str, int], Tuple[float, str]]" = OrderedDict()
+# Per-URL locks of in-flight fetches and the number of callers using each
+_fetch_locks: Dict[str, asyncio.Lock] = {}
+_fetch_lock_users: Dict[str, int] = {}
+
+# Session shared by all SearchClient instances so connections, DNS and TLS
+# sessions are reused across searches; closed by close_shared_session
+_shared_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_shared_session(
+    headers: Dict[str, str], timeout: aiohttp.ClientTimeout
+) -> aiohttp.ClientSession:
+    """
+    Gets the shared aiohttp session, creating it on first use.
+    """
+    global _shared_session
+    # No await between the check and the assignment, so no lock is needed
+    if _shared_session is None or _shared_session.closed:
+        _shared_session = aiohttp.ClientSession(
+            timeout=timeout,
+            headers=headers,
+            connector=aiohttp.TCPConnector(
+                limit=10,
+                limit_per_host=5,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+                enable_cleanup_closed=True,
+            ),
+        )
+    return _shared_session
+
+
+async def close_shared_session():
+    """
+    Closes the shared aiohttp session.
+    """
+    global _shared_session
+    if _shared_session and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+
+
+def _get_cached_content(key: Tuple[str, int]) -> Optional[str]:
+    """
+    Looks up extracted page text, if still fresh, and marks it as recently used.
+    """
+    entry = _content_cache.get(key)
+    if entry is None:
+        return None
+
+    timestamp, content = entry
+    if time.monotonic() - timestamp >= CONTENT_CACHE_TTL:
+        del _content_cache[key]
+        return None
+
+    _content_cache.move_to_end(key)
+    logger.info(f"Webpage content cache hit: {key[0]}")
+    return content
+
+
+def clear_content_cache():
+    """
+    Clears the cache of extracted page text.
+    """
+    _content_cache.clear()
+
 
 class SearchClient:
     """
     Asynchronous search client.
     """
 
-    def __init__(self):
-        self.session: Optional[aiohttp.ClientSession] = None
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        # An injected session is used as-is; otherwise the shared one is used
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._session_injected = session is not None
         self.user_agent = (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -47,20 +197,19 @@ class SearchClient:
         """
         Asynchronous context manager entry.
         """
-        if self.session is None:
-            self.session = aiohttp.ClientSession(
-                timeout=self.timeout,
-                headers=self.base_headers,
-                connector=aiohttp.TCPConnector(limit=10, limit_per_host=5),
-            )
+        if not self._session_injected:
+            self.session = get_shared_session(self.base_headers, self.timeout)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """
         Asynchronous context manager exit.
+
+        The session is not owned by the client, so it is only released here;
+        the shared session is closed by close_shared_session.
         """
-        if self.session:
-            await self.session.close()
+        if not self._session_injected:
+            self.session = None
 
     async def search_bing(self, query: SearchQuery) -> List[SearchResult]:
         """Performs a Bing search.
@@ -123,18 +272,11 @@ class SearchClient:
         Returns:
             List of search results
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=RESULTS_STRAINER)
         results = []
 
         # Try multiple selector strategies
-        selectors = [
-            "#b_results > li.b_algo",
-            "#b_results > .b_ans",
-            "#b_results > li:not(.b_ad)",
-            ".b_algo",
-        ]
-
-        for selector in selectors:
+        for selector in RESULT_SELECTORS:
             elements = soup.select(selector)
             logger.info(f"Selector '{selector}' found {len(elements)} elements")
 
@@ -206,7 +348,10 @@ class SearchClient:
         return results
 
     async def fetch_webpage_content(self, url: str, max_length: int = 8000) -> str:
-        """Fetches webpage content.
+        """Fetches webpage content, served from the content cache when possible.
+
+        Concurrent fetches of the same URL wait for the first one and reuse
+        its result instead of downloading the page again.
 
         Args:
             url: Webpage URL
@@ -215,6 +360,47 @@ class SearchClient:
         Returns:
             Webpage text content
         """
+        key = (url, max_length)
+        content = _get_cached_content(key)
+        if content is not None:
+            return content
+
+        # The lock stays registered until its last user is done, so callers
+        # woken but not yet holding it still coalesce with new callers
+        lock = _fetch_locks.setdefault(url, asyncio.Lock())
+        _fetch_lock_users[url] = _fetch_lock_users.get(url, 0) + 1
+        try:
+            async with lock:
+                # Another caller may have fetched it while we waited
+                content = _get_cached_content(key)
+                if content is None:
+                    content, cacheable = await self._fetch_webpage_content(
+                        url, max_length
+                    )
+                    if cacheable:
+                        _content_cache[key] = (time.monotonic(), content)
+                        if len(_content_cache) > CONTENT_CACHE_SIZE:
+                            _content_cache.popitem(last=False)
+                return content
+        finally:
+            _fetch_lock_users[url] -= 1
+            if not _fetch_lock_users[url]:
+                del _fetch_lock_users[url]
+                del _fetch_locks[url]
+
+    async def _fetch_webpage_content(
+        self, url: str, max_length: int
+    ) -> Tuple[str, bool]:
+        """Downloads a webpage and extracts its text content.
+
+        Args:
+            url: Webpage URL
+            max_length: Maximum content length
+
+        Returns:
+            Webpage text content, and whether it is page text worth caching
+            rather than a message about a page that could not be read
+        """
         try:
             if not self.session:
                 raise RuntimeError(
@@ -234,25 +420,37 @@ class SearchClient:
                 # Get content type
                 content_type = response.headers.get("content-type", "").lower()
                 if "text/html" not in content_type:
-                    return f"Unsupported content type: {content_type}"
-
-                # Read content
-                content = await response.read()
+                    return f"Unsupported content type: {content_type}", False
 
-                # Try to detect encoding
-                encoding = "utf-8"
-                charset_match = re.search(r"charset=([^;]+)", content_type)
-                if charset_match:
-                    encoding = charset_match.group(1).strip()
+                # Reject oversized bodies before reading any of them
+                if (response.content_length or 0) > MAX_CONTENT_LENGTH:
+                    return f"Webpage too large: {response.content_length} bytes", False
 
+                # Use the charset aiohttp parsed from the content-type header
+                encoding = response.charset or "utf-8"
                 try:
-                    html = content.decode(encoding)
-                except UnicodeDecodeError:
-                    logger.warning(f"Failed to decode with {encoding}, falling back to utf-8")
-                    html = content.decode("utf-8", errors="ignore")
+                    # Incremental decoding tolerates a character split across chunks
+                    decoder = codecs.getincrementaldecoder(encoding)(errors="ignore")
+                except LookupError:
+                    logger.warning(f"Unknown encoding {encoding}, falling back to utf-8")
+                    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+
+                # Read only as much of the body as the parser will be given
+                parts = []
+                char_count = 0
+                byte_count = 0
+                async for chunk in response.content.iter_chunked(FETCH_CHUNK_SIZE):
+                    text = decoder.decode(chunk)
+                    parts.append(text)
+                    char_count += len(text)
+                    byte_count += len(chunk)
+                    if char_count >= MAX_PARSE_CHARS or byte_count >= FETCH_MAX_BYTES:
+                        break
+                html = "".join(parts)
 
                 # Parse webpage content
-                return await self._extract_webpage_content(html, url, max_length)
+                content = await self._extract_webpage_content(html, url, max_length)
+                return content, True
 
         except Exception as e:
             logger.error(f"Failed to fetch webpage content: {e}")
@@ -271,48 +469,15 @@ class SearchClient:
         Returns:
             Extracted text content
         """
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Remove unnecessary elements
-        for tag in soup(
-            ["script", "style", "iframe", "noscript", "nav", "header", "footer"]
-        ):
-            tag.decompose()
-
-        # Remove elements with specific class names
-        for selector in [
-            ".ad",
-            ".advertisement",
-            ".sidebar",
-            ".nav",
-            ".header",
-            ".footer",
-        ]:
-            for element in soup.select(selector):
-                element.decompose()
+        soup = BeautifulSoup(html[:MAX_PARSE_CHARS], HTML_PARSER)
+
+        # Remove unnecessary elements and elements with specific class names
+        for element in soup.select(DROP_SELECTOR):
+            element.decompose()
 
         # Try to find the main content area
         main_content = ""
-        content_selectors = [
-            "main",
-            "article",
-            ".article",
-            ".post",
-            ".content",
-            "#content",
-            ".main",
-            "#main",
-            ".body",
-            "#body",
-            ".entry",
-            ".entry-content",
-            ".post-content",
-            ".article-content",
-            ".text",
-            ".detail",
-        ]
-
-        for selector in content_selectors:
+        for selector in CONTENT_SELECTORS:
             element = soup.select_one(selector)
             if element:
                 main_content = element.get_text(separator=" ", strip=True)
@@ -337,7 +502,7 @@ class SearchClient:
                 main_content = body.get_text(separator=" ", strip=True)
 
         # Clean up the text
-        main_content = re.sub(r"\s+", " ", main_content).strip()
+        main_content = WHITESPACE_RE.sub(" ", main_content).strip()
 
         # Add the title
         title_element = soup.find("title")
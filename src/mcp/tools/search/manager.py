@@ -2,15 +2,34 @@
 Search Manager - Responsible for managing and coordinating search functions.
 """
 
-from typing import List
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Collection, Dict, List, Optional, Tuple, Union
 
 from src.utils.logging_config import get_logger
 
-from .client import SearchClient
+from .client import SearchClient, clear_content_cache, close_shared_session
 from .models import SearchQuery, SearchResult, SearchSession
+from .tools import (
+    fetch_many_webpages,
+    fetch_webpage_content,
+    get_search_results,
+    search_bing,
+)
 
 logger = get_logger(__name__)
 
+# Recent search results reused for identical queries
+QUERY_CACHE_SIZE = 64
+QUERY_CACHE_TTL = 300  # seconds
+
+# Webpages fetched at once by fetch_contents
+FETCH_CONCURRENCY = 8
+
+# Error and "no results" placeholders link back to the Bing search page
+FALLBACK_URL_PREFIX = "https://www.bing.com/search?"
+
 
 class SearchManager:
     """
@@ -21,6 +40,12 @@ class SearchManager:
         self.current_session = SearchSession()
         self.client = SearchClient()
         self._client_initialized = False
+        # (query, num_results, language, region) -> (monotonic time, results)
+        self._query_cache: "OrderedDict[Tuple, Tuple[float, List[SearchResult]]]" = (
+            OrderedDict()
+        )
+        # Searches in progress, awaited by identical concurrent searches
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
 
     async def _ensure_client_initialized(self):
         """
@@ -42,13 +67,17 @@ class SearchManager:
         """
         Initializes and registers all search tools.
         """
-        from .tools import fetch_webpage_content, get_search_results, search_bing
-
         # Bing search tool
         search_bing_props = PropertyList(
             [
                 Property("query", PropertyType.STRING),
-                Property("num_results", PropertyType.INTEGER, default_value=5),
+                Property(
+                    "num_results",
+                    PropertyType.INTEGER,
+                    default_value=5,
+                    min_value=1,
+                    max_value=10,
+                ),
                 Property("language", PropertyType.STRING, default_value="en-us"),
                 Property("region", PropertyType.STRING, default_value="US"),
             ]
@@ -87,7 +116,13 @@ class SearchManager:
         fetch_webpage_props = PropertyList(
             [
                 Property("result_id", PropertyType.STRING),
-                Property("max_length", PropertyType.INTEGER, default_value=8000),
+                Property(
+                    "max_length",
+                    PropertyType.INTEGER,
+                    default_value=8000,
+                    min_value=1000,
+                    max_value=20000,
+                ),
             ]
         )
         add_tool(
@@ -123,6 +158,40 @@ class SearchManager:
             )
         )
 
+        # Batch webpage content fetching tool
+        fetch_many_props = PropertyList(
+            [
+                Property("result_ids", PropertyType.STRING),
+                Property(
+                    "max_length",
+                    PropertyType.INTEGER,
+                    default_value=8000,
+                    min_value=1000,
+                    max_value=20000,
+                ),
+            ]
+        )
+        add_tool(
+            (
+                "self.search.fetch_many",
+                "Fetch and extract the main content of several search results at "
+                "once. The webpages are downloaded concurrently, so this is faster "
+                "than calling self.search.fetch_webpage for each result.\n"
+                "Use this tool when the user wants to:\n"
+                "1. Read or compare several of the search results\n"
+                "2. Gather information spread across multiple webpages\n"
+                "\nEach result is reported separately, so one page failing does not "
+                "affect the others.\n"
+                "\nArgs:\n"
+                "  result_ids: Comma-separated result IDs from the search "
+                "(required, max: 10)\n"
+                "  max_length: Maximum content length per page in characters "
+                "(default: 8000)",
+                fetch_many_props,
+                fetch_many_webpages,
+            )
+        )
+
         # Get search results tool
         get_results_props = PropertyList(
             [
@@ -166,8 +235,6 @@ class SearchManager:
             List of search results
         """
         try:
-            await self._ensure_client_initialized()
-
             # Create a search query
             search_query = SearchQuery(
                 query=query,
@@ -176,8 +243,22 @@ class SearchManager:
                 region=region,
             )
 
-            # Perform the search
-            results = await self.client.search_bing(search_query)
+            key = (query.strip().casefold(), num_results, language, region)
+            results = self._get_cached_query(key)
+            while results is None:
+                future = self._inflight.get(key)
+                if future is None:
+                    results = await self._run_search(search_query, key)
+                    break
+
+                try:
+                    # Shielded so a cancelled waiter does not cancel the search
+                    results = await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    # Only the search's own caller was cancelled, not this one;
+                    # take over the search instead of failing
+                    if not future.cancelled() or asyncio.current_task().cancelling():
+                        raise
 
             # Cache the results
             for result in results:
@@ -193,6 +274,82 @@ class SearchManager:
             logger.error(f"Search failed: {e}")
             raise e
 
+    async def _run_search(
+        self, search_query: SearchQuery, key: Tuple
+    ) -> List[SearchResult]:
+        """
+        Performs a Bing search, sharing its outcome with identical searches
+        started while it runs.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            await self._ensure_client_initialized()
+
+            # Perform the search
+            results = await self.client.search_bing(search_query)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark as retrieved in case no other search is waiting on it
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+        # Placeholders for failed or unparsable searches are not reused
+        if not all(r.url.startswith(FALLBACK_URL_PREFIX) for r in results):
+            self._query_cache[key] = (time.monotonic(), results)
+            if len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+
+        future.set_result(results)
+        return results
+
+    async def fetch_contents(
+        self, result_ids: List[str], max_length: int = 8000
+    ) -> Dict[str, Union[str, Exception]]:
+        """Fetches the webpage content of several search results concurrently.
+
+        Args:
+            result_ids: Search result IDs
+            max_length: Maximum content length per page
+
+        Returns:
+            Content per result ID, or the exception raised while fetching it
+        """
+        semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+        async def fetch_one(result_id: str) -> str:
+            async with semaphore:
+                return await self.fetch_content(result_id, max_length)
+
+        result_ids = list(dict.fromkeys(result_ids))
+        contents = await asyncio.gather(
+            *(fetch_one(result_id) for result_id in result_ids),
+            return_exceptions=True,
+        )
+        return dict(zip(result_ids, contents))
+
+    def _get_cached_query(self, key: Tuple) -> Optional[List[SearchResult]]:
+        """
+        Gets the results of a recent identical search, if still fresh.
+        """
+        entry = self._query_cache.get(key)
+        if entry is None:
+            return None
+
+        timestamp, results = entry
+        if time.monotonic() - timestamp >= QUERY_CACHE_TTL:
+            del self._query_cache[key]
+            return None
+
+        self._query_cache.move_to_end(key)
+        logger.info(f"Search cache hit: {key[0]}")
+        return results
+
     async def fetch_content(self, result_id: str, max_length: int = 8000) -> str:
         """Fetches webpage content.
 
@@ -214,9 +371,9 @@ class SearchManager:
             # Fetch the webpage content
             content = await self.client.fetch_webpage_content(result.url, max_length)
 
-            # Update the content of the search result
+            # The cached result is updated in place
             result.content = content
-            self.current_session.add_result(result)  # Update the cache
+            self.current_session.touch()
 
             logger.info(f"Finished fetching webpage content: {result.url}")
             return content
@@ -226,7 +383,10 @@ class SearchManager:
             raise e
 
     def get_cached_results(self, session_id: str = None) -> List[SearchResult]:
-        """Gets cached search results.
+        """Gets a snapshot of the cached search results.
+
+        This copies every cached result into a new list; use
+        iter_cached_results when a live view is enough.
 
         Args:
             session_id: Session ID, uses the current session if None
@@ -234,31 +394,52 @@ class SearchManager:
         Returns:
             List of search results
         """
+        return list(self.iter_cached_results(session_id))
+
+    def iter_cached_results(self, session_id: str = None) -> Collection[SearchResult]:
+        """Gets a live view of the cached search results without copying.
+
+        The view must not be iterated across an await that may change the
+        cache.
+
+        Args:
+            session_id: Session ID, uses the current session if None
+
+        Returns:
+            View of the search results
+        """
         if session_id and session_id != self.current_session.id:
-            # If a different session ID is specified, temporarily return an empty list
+            # If a different session ID is specified, temporarily return nothing
             # In a real application, multi-session management could be implemented
-            return []
+            return ()
 
-        return list(self.current_session.results.values())
+        return self.current_session.results.values()
+
+    def get_result_by_id(self, result_id: str) -> Optional[SearchResult]:
+        """Gets a cached search result of the current session by ID.
+
+        Args:
+            result_id: Search result ID
+
+        Returns:
+            The search result, or None if it is not cached
+        """
+        return self.current_session.results.get(result_id)
 
     def clear_cache(self):
         """
         Clears the search cache.
         """
         self.current_session.clear_results()
+        self._query_cache.clear()
+        clear_content_cache()
         logger.info("Search cache has been cleared")
 
     def get_session_info(self) -> dict:
         """
         Gets information about the current session.
         """
-        return {
-            "session_id": self.current_session.id,
-            "total_results": len(self.current_session.results),
-            "total_queries": len(self.current_session.queries),
-            "created_at": self.current_session.created_at,
-            "last_accessed": self.current_session.last_accessed,
-        }
+        return self.current_session.info_dict()
 
 
 # Global manager instance
@@ -283,3 +464,4 @@ async def cleanup_search_manager():
     if _search_manager:
         await _search_manager.cleanup()
         _search_manager = None
+    await close_shared_session()
@@ -2,7 +2,9 @@
 Search data models.
 """
 
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -22,27 +24,63 @@ class SearchResult:
         source: str = "bing",
         created_at: str = None,
     ):
-        self.id = result_id or str(uuid.uuid4())
+        self.id = result_id or uuid.uuid4().hex
         self.title = title
         self.url = url
         self.snippet = snippet
-        self.content = content
+        self._content = content
         self.source = source
         self.created_at = created_at or datetime.now().isoformat()
+        # Serialized forms, built on first use; the full one is reset when
+        # the content changes
+        self._cached_dict: Optional[Dict[str, Any]] = None
+        self._summary_dict: Optional[Dict[str, Any]] = None
+
+    @property
+    def content(self) -> Optional[str]:
+        """
+        Fetched webpage content, if any.
+        """
+        return self._content
+
+    @content.setter
+    def content(self, value: Optional[str]) -> None:
+        self._content = value
+        self._cached_dict = None
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to a dictionary.
+
+        The dictionary is cached and shared, so callers must not modify it.
         """
-        return {
-            "id": self.id,
-            "title": self.title,
-            "url": self.url,
-            "snippet": self.snippet,
-            "content": self.content,
-            "source": self.source,
-            "created_at": self.created_at,
-        }
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "id": self.id,
+                "title": self.title,
+                "url": self.url,
+                "snippet": self.snippet,
+                "content": self._content,
+                "source": self.source,
+                "created_at": self.created_at,
+            }
+        return self._cached_dict
+
+    def to_summary_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a dictionary without the content, as listed by the tools.
+
+        The dictionary is cached and shared, so callers must not modify it.
+        """
+        if self._summary_dict is None:
+            self._summary_dict = {
+                "id": self.id,
+                "title": self.title,
+                "url": self.url,
+                "snippet": self.snippet,
+                "source": self.source,
+            }
+        return self._summary_dict
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SearchResult":
@@ -74,7 +112,7 @@ class SearchQuery:
         safe_search: str = "moderate",
         query_id: str = None,
     ):
-        self.id = query_id or str(uuid.uuid4())
+        self.id = query_id or uuid.uuid4().hex
         self.query = query
         self.num_results = num_results
         self.language = language
@@ -116,40 +154,91 @@ class SearchSession:
     Search session model, used for caching search results.
     """
 
-    def __init__(self, session_id: str = None):
-        self.id = session_id or str(uuid.uuid4())
-        self.results: Dict[str, SearchResult] = {}
+    def __init__(self, session_id: str = None, max_entries: int = 256):
+        self.id = session_id or uuid.uuid4().hex
+        # Least recently used results are evicted beyond max_entries
+        self.results: "OrderedDict[str, SearchResult]" = OrderedDict()
+        self.max_entries = max_entries
         self.queries: List[SearchQuery] = []
-        self.created_at = datetime.now().isoformat()
-        self.last_accessed = datetime.now().isoformat()
+        # Epoch timestamps, formatted as ISO strings only when read
+        self.created_at_ts = time.time()
+        self.last_accessed_ts = self.created_at_ts
+        # Summary returned by info_dict, rebuilt after the session changes
+        self._info_cache: Optional[Dict[str, Any]] = None
+        self._info_dirty = True
+
+    @property
+    def created_at(self) -> str:
+        """
+        Session creation time as an ISO string.
+        """
+        return datetime.fromtimestamp(self.created_at_ts).isoformat()
+
+    @property
+    def last_accessed(self) -> str:
+        """
+        Last access time as an ISO string.
+        """
+        return datetime.fromtimestamp(self.last_accessed_ts).isoformat()
 
     def add_result(self, result: SearchResult) -> None:
         """
         Add a search result to the session.
         """
         self.results[result.id] = result
-        self.last_accessed = datetime.now().isoformat()
+        self.results.move_to_end(result.id)
+        while len(self.results) > self.max_entries:
+            self.results.popitem(last=False)
+        self.touch()
 
     def get_result(self, result_id: str) -> Optional[SearchResult]:
         """
         Get a search result from the session.
         """
-        self.last_accessed = datetime.now().isoformat()
-        return self.results.get(result_id)
+        self.touch()
+        result = self.results.get(result_id)
+        if result is not None:
+            self.results.move_to_end(result_id)
+        return result
+
+    def touch(self) -> None:
+        """
+        Mark the session as accessed.
+        """
+        self.last_accessed_ts = time.time()
+        self._info_dirty = True
 
     def add_query(self, query: SearchQuery) -> None:
         """
         Add a search query to the session.
         """
         self.queries.append(query)
-        self.last_accessed = datetime.now().isoformat()
+        self.touch()
 
     def clear_results(self) -> None:
         """
         Clear the search results.
         """
         self.results.clear()
-        self.last_accessed = datetime.now().isoformat()
+        self.touch()
+
+    def info_dict(self) -> Dict[str, Any]:
+        """
+        Summarize the session without its results.
+
+        The dictionary is cached until the session changes and is shared, so
+        callers must not modify it.
+        """
+        if self._info_dirty or self._info_cache is None:
+            self._info_cache = {
+                "session_id": self.id,
+                "total_results": len(self.results),
+                "total_queries": len(self.queries),
+                "created_at": self.created_at,
+                "last_accessed": self.last_accessed,
+            }
+            self._info_dirty = False
+        return self._info_cache
 
     def to_dict(self) -> Dict[str, Any]:
         """
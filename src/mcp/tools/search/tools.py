@@ -3,14 +3,41 @@ Search MCP tool functions - asynchronous tool functions provided for MCP server
 """
 
 import json
+import os
 from typing import Any, Dict
 
+# orjson is optional; the standard library encoder is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.utils.logging_config import get_logger
 
-from .manager import get_search_manager
+# Imported as a module, since manager.py imports these tools at load time;
+# the manager is looked up when a tool runs
+from . import manager as _manager
 
 logger = get_logger(__name__)
 
+# Responses are read by the MCP client, so they are compact unless
+# MCP_PRETTY_JSON=1 asks for indented output while debugging
+_PRETTY = os.getenv("MCP_PRETTY_JSON") == "1"
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | (
+        orjson.OPT_INDENT_2 if _PRETTY else 0
+    )
+
+    def _dumps(data: Any) -> str:
+        return orjson.dumps(data, option=_ORJSON_OPTIONS).decode()
+
+else:
+    _JSON_FORMAT = {"indent": 2} if _PRETTY else {"separators": (",", ":")}
+
+    def _dumps(data: Any) -> str:
+        return json.dumps(data, ensure_ascii=False, **_JSON_FORMAT)
+
 
 async def search_bing(args: Dict[str, Any]) -> str:
     """Execute a Bing search.
@@ -28,22 +55,16 @@ async def search_bing(args: Dict[str, Any]) -> str:
     try:
         query = args.get("query")
         if not query:
-            return json.dumps(
-                {"success": False, "message": "Search keyword cannot be empty"},
-                ensure_ascii=False,
+            return _dumps(
+                {"success": False, "message": "Search keyword cannot be empty"}
             )
 
-        num_results = args.get("num_results", 5)
+        # Limit the number of search results
+        num_results = max(1, min(10, int(args.get("num_results") or 5)))
         language = args.get("language", "en-us")
         region = args.get("region", "US")
 
-        # Limit the number of search results
-        if num_results > 10:
-            num_results = 10
-        elif num_results < 1:
-            num_results = 1
-
-        manager = get_search_manager()
+        manager = _manager.get_search_manager()
         results = await manager.search(
             query=query,
             num_results=num_results,
@@ -52,36 +73,21 @@ async def search_bing(args: Dict[str, Any]) -> str:
         )
 
         # Format results
-        formatted_results = []
-        for result in results:
-            formatted_results.append(
-                {
-                    "id": result.id,
-                    "title": result.title,
-                    "url": result.url,
-                    "snippet": result.snippet,
-                    "source": result.source,
-                }
-            )
+        formatted_results = [result.to_summary_dict() for result in results]
 
-        return json.dumps(
+        return _dumps(
             {
                 "success": True,
                 "query": query,
                 "num_results": len(formatted_results),
                 "results": formatted_results,
                 "session_info": manager.get_session_info(),
-            },
-            ensure_ascii=False,
-            indent=2,
+            }
         )
 
     except Exception as e:
         logger.error(f"Search failed: {e}")
-        return json.dumps(
-            {"success": False, "message": f"Search failed: {str(e)}"},
-            ensure_ascii=False,
-        )
+        return _dumps({"success": False, "message": f"Search failed: {str(e)}"})
 
 
 async def fetch_webpage_content(args: Dict[str, Any]) -> str:
@@ -98,53 +104,97 @@ async def fetch_webpage_content(args: Dict[str, Any]) -> str:
     try:
         result_id = args.get("result_id")
         if not result_id:
-            return json.dumps(
-                {"success": False, "message": "Search result ID cannot be empty"},
-                ensure_ascii=False,
+            return _dumps(
+                {"success": False, "message": "Search result ID cannot be empty"}
             )
 
-        max_length = args.get("max_length", 8000)
-
         # Limit content length
-        if max_length > 20000:
-            max_length = 20000
-        elif max_length < 1000:
-            max_length = 1000
+        max_length = max(1000, min(20000, int(args.get("max_length") or 8000)))
 
-        manager = get_search_manager()
+        manager = _manager.get_search_manager()
         content = await manager.fetch_content(result_id, max_length)
 
         # Get corresponding search result information
-        cached_results = manager.get_cached_results()
-        result_info = None
-        for result in cached_results:
-            if result.id == result_id:
-                result_info = {
-                    "id": result.id,
-                    "title": result.title,
-                    "url": result.url,
-                    "snippet": result.snippet,
-                    "source": result.source,
-                }
-                break
+        result = manager.get_result_by_id(result_id)
+        result_info = result.to_summary_dict() if result else None
 
-        return json.dumps(
+        return _dumps(
             {
                 "success": True,
                 "result_id": result_id,
                 "result_info": result_info,
                 "content": content,
                 "content_length": len(content),
-            },
-            ensure_ascii=False,
-            indent=2,
+            }
         )
 
     except Exception as e:
         logger.error(f"Failed to fetch webpage content: {e}")
-        return json.dumps(
-            {"success": False, "message": f"Failed to fetch webpage content: {str(e)}"},
-            ensure_ascii=False,
+        return _dumps(
+            {"success": False, "message": f"Failed to fetch webpage content: {str(e)}"}
+        )
+
+
+async def fetch_many_webpages(args: Dict[str, Any]) -> str:
+    """Fetch the content of several webpages concurrently.
+
+    Args:
+        args: A dictionary containing fetch parameters
+            - result_ids: Comma-separated search result IDs (at most 10)
+            - max_length: Maximum content length per page (default: 8000)
+
+    Returns:
+        Webpage contents, one entry per result ID
+    """
+    try:
+        result_ids = [
+            result_id.strip()
+            for result_id in (args.get("result_ids") or "").split(",")
+            if result_id.strip()
+        ]
+        if not result_ids:
+            return _dumps(
+                {"success": False, "message": "Search result IDs cannot be empty"}
+            )
+
+        # Limit the number of pages and the content length
+        result_ids = result_ids[:10]
+        max_length = max(1000, min(20000, int(args.get("max_length") or 8000)))
+
+        manager = _manager.get_search_manager()
+        contents = await manager.fetch_contents(result_ids, max_length)
+
+        formatted_results = []
+        for result_id, content in contents.items():
+            if isinstance(content, Exception):
+                formatted_results.append(
+                    {"result_id": result_id, "success": False, "message": str(content)}
+                )
+                continue
+
+            result = manager.get_result_by_id(result_id)
+            formatted_results.append(
+                {
+                    "result_id": result_id,
+                    "success": True,
+                    "result_info": result.to_summary_dict() if result else None,
+                    "content": content,
+                    "content_length": len(content),
+                }
+            )
+
+        return _dumps(
+            {
+                "success": True,
+                "total_results": len(formatted_results),
+                "results": formatted_results,
+            }
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to fetch webpage contents: {e}")
+        return _dumps(
+            {"success": False, "message": f"Failed to fetch webpage contents: {str(e)}"}
         )
 
 
@@ -161,41 +211,34 @@ async def get_search_results(args: Dict[str, Any]) -> str:
     try:
         session_id = args.get("session_id")
 
-        manager = get_search_manager()
-        results = manager.get_cached_results(session_id)
+        manager = _manager.get_search_manager()
+        results = manager.iter_cached_results(session_id)
 
         # Format results
         formatted_results = []
         for result in results:
             formatted_results.append(
                 {
-                    "id": result.id,
-                    "title": result.title,
-                    "url": result.url,
-                    "snippet": result.snippet,
-                    "source": result.source,
+                    **result.to_summary_dict(),
                     "has_content": bool(result.content),
                     "created_at": result.created_at,
                 }
             )
 
-        return json.dumps(
+        return _dumps(
             {
                 "success": True,
                 "session_id": session_id or manager.current_session.id,
                 "total_results": len(formatted_results),
                 "results": formatted_results,
                 "session_info": manager.get_session_info(),
-            },
-            ensure_ascii=False,
-            indent=2,
+            }
         )
 
     except Exception as e:
         logger.error(f"Failed to get search result cache: {e}")
-        return json.dumps(
-            {"success": False, "message": f"Failed to get search result cache: {str(e)}"},
-            ensure_ascii=False,
+        return _dumps(
+            {"success": False, "message": f"Failed to get search result cache: {str(e)}"}
         )
 
 
@@ -209,24 +252,22 @@ async def clear_search_cache(args: Dict[str, Any]) -> str:
         Operation result
     """
     try:
-        manager = get_search_manager()
-        old_count = len(manager.get_cached_results())
+        manager = _manager.get_search_manager()
+        old_count = len(manager.iter_cached_results())
         manager.clear_cache()
 
-        return json.dumps(
+        return _dumps(
             {
                 "success": True,
                 "message": f"Search cache cleared, {old_count} results removed",
                 "cleared_count": old_count,
-            },
-            ensure_ascii=False,
+            }
         )
 
     except Exception as e:
         logger.error(f"Failed to clear search cache: {e}")
-        return json.dumps(
-            {"success": False, "message": f"Failed to clear search cache: {str(e)}"},
-            ensure_ascii=False,
+        return _dumps(
+            {"success": False, "message": f"Failed to clear search cache: {str(e)}"}
         )
 
 
@@ -240,21 +281,18 @@ async def get_session_info(args: Dict[str, Any]) -> str:
         Session information
     """
     try:
-        manager = get_search_manager()
+        manager = _manager.get_search_manager()
         session_info = manager.get_session_info()
 
-        return json.dumps(
+        return _dumps(
             {
                 "success": True,
                 "session_info": session_info,
-            },
-            ensure_ascii=False,
-            indent=2,
+            }
         )
 
     except Exception as e:
         logger.error(f"Failed to get session information: {e}")
-        return json.dumps(
-            {"success": False, "message": f"Failed to get session information: {str(e)}"},
-            ensure_ascii=False,
+        return _dumps(
+            {"success": False, "message": f"Failed to get session information: {str(e)}"}
         )